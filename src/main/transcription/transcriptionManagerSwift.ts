@@ -1,24 +1,10 @@
 import * as path from 'path';
 import * as fs from 'fs';
 import { nativeAudioProcessor } from '../../native/nativeAudioProcessor';
+import type { TranscriptionResult, SpeakerSegment } from '../../types/transcription';
 
-// Re-export the interfaces from the original transcriptionManager for compatibility
-export interface TranscriptionResult {
-  text: string;
-  language?: string;
-  duration?: number;
-  success: boolean;
-  error?: string;
-  speakers?: SpeakerSegment[];
-}
-
-export interface SpeakerSegment {
-  speaker: string;
-  text: string;
-  startTime: number;
-  endTime: number;
-  confidence?: number;
-}
+// Re-export the shared interfaces for existing importers of this module
+export type { TranscriptionResult, SpeakerSegment };
 
 /**
  * Swift-Native Transcription Manager
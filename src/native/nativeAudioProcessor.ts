@@ -33,6 +33,7 @@ interface SwiftProcessingResult {
  */
 export class NativeAudioProcessor {
   private isInitialized = false;
+  private initializationPromise: Promise<boolean> | null = null;
 
   constructor() {
     // Native Swift audio processor ready
@@ -47,6 +48,17 @@ export class NativeAudioProcessor {
       return true;
     }
 
+    // Share one in-flight initialization so concurrent callers don't load the models twice
+    if (!this.initializationPromise) {
+      this.initializationPromise = this.initializeNative();
+    }
+
+    const success = await this.initializationPromise;
+    this.initializationPromise = null;
+    return success;
+  }
+
+  private async initializeNative(): Promise<boolean> {
     try {
       const result = await SwiftProcessRunner.runCommand({
         command: ['init'],
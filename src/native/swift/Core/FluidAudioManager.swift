@@ -1,6 +1,8 @@
 import Foundation
 import FluidAudio
 import AVFoundation
+import CoreML
+import Accelerate
 
 @available(macOS 14.0, *)
 public class FluidAudioManager: ObservableObject {
@@ -15,12 +17,19 @@ public class FluidAudioManager: ObservableObject {
         let enableVAD: Bool
         let minSpeakerDuration: Double
         let maxSpeakers: Int
+        let allowLowPrecisionGPU: Bool  // FP16 accumulation on GPU for segmentation + embedding models
+        let prewarm: Bool  // Run a dummy diarization at startup so CoreML specialization isn't paid on the first request
+        let debugLogging: Bool  // Per-chunk/per-segment VAD diagnostics (costly: runs inside the 32ms chunk loop)
 
-        public init(sampleRate: Int = 16000, enableVAD: Bool = true, minSpeakerDuration: Double = 0.5, maxSpeakers: Int = 10) {
+        public init(sampleRate: Int = 16000, enableVAD: Bool = true, minSpeakerDuration: Double = 0.5, maxSpeakers: Int = 10,
+                    allowLowPrecisionGPU: Bool = true, prewarm: Bool = true, debugLogging: Bool = false) {
             self.sampleRate = sampleRate
             self.enableVAD = enableVAD
             self.minSpeakerDuration = minSpeakerDuration
             self.maxSpeakers = maxSpeakers
+            self.allowLowPrecisionGPU = allowLowPrecisionGPU
+            self.prewarm = prewarm
+            self.debugLogging = debugLogging
         }
 
         public static let `default` = Configuration()
@@ -35,6 +44,7 @@ public class FluidAudioManager: ObservableObject {
         print("   VAD Enabled: \(configuration.enableVAD)")
         print("   Min Speaker Duration: \(configuration.minSpeakerDuration)s")
         print("   Max Speakers: \(configuration.maxSpeakers)")
+        print("   GPU Precision: \(configuration.allowLowPrecisionGPU ? "FP16" : "FP32")")
     }
 
     // MARK: - Initialization
@@ -50,11 +60,28 @@ public class FluidAudioManager: ObservableObject {
         do {
             // Download models if needed
             print("📥 Downloading FluidAudio models if needed...")
-            currentModels = try await DiarizerModels.downloadIfNeeded()
+            let modelConfig = MLModelConfiguration()
+            modelConfig.computeUnits = .all
+            modelConfig.allowLowPrecisionAccumulationOnGPU = config.allowLowPrecisionGPU
+            currentModels = try await DiarizerModels.downloadIfNeeded(configuration: modelConfig)
 
             // Initialize the diarizer with downloaded models
             print("🎯 Initializing diarizer with models...")
             diarizer.initialize(models: currentModels!)
+
+            // Prewarm with 10s of silence so model compilation and kernel selection happen now
+            if config.prewarm {
+                print("🔥 Prewarming diarizer models...")
+                let prewarmStart = Date()
+                let warmupSamples = [Float](repeating: 0, count: config.sampleRate * 10)
+                do {
+                    _ = try diarizer.performCompleteDiarization(warmupSamples, sampleRate: config.sampleRate)
+                    print("   Prewarm took \(String(format: "%.2f", Date().timeIntervalSince(prewarmStart)))s")
+                } catch {
+                    // A failed prewarm only costs first-call latency, so keep initializing
+                    print("⚠️ Diarizer prewarm failed: \(error)")
+                }
+            }
             
             // Initialize VAD Manager with optimized configuration
             if config.enableVAD {
@@ -114,6 +141,12 @@ public class FluidAudioManager: ObservableObject {
         return try await performDiarizationCore(audioSamples: audioSamples, context: "file")
     }
 
+    // Diarize samples that were already decoded (mono, config.sampleRate) so callers can share one decode
+    public func performDiarization(audioSamples: [Float]) async throws -> FluidAudioDiarizationResult {
+        print("🎭 Starting sample diarization: \(audioSamples.count) samples")
+        return try await performDiarizationCore(audioSamples: audioSamples, context: "samples")
+    }
+
     public func performDiarization(audioBuffer: AVAudioPCMBuffer) async throws -> FluidAudioDiarizationResult {
         print("🎭 Starting buffer diarization...")
         let audioSamples = bufferToFloatArray(audioBuffer)
@@ -130,11 +163,11 @@ public class FluidAudioManager: ObservableObject {
             let result = try diarizer.performCompleteDiarization(audioSamples, sampleRate: config.sampleRate)
 
             // Convert to our result format
-            let speakerSegments = convertDiarizationResult(result)
+            let (speakerSegments, totalSpeakers) = convertDiarizationResult(result)
 
             let diarizationResult = FluidAudioDiarizationResult(
                 speakers: speakerSegments,
-                totalSpeakers: speakerSegments.map { $0.speakerId }.uniqued().count,
+                totalSpeakers: totalSpeakers,
                 processingTime: 0.0, // FluidAudio doesn't provide this directly
                 success: true
             )
@@ -180,30 +213,69 @@ public class FluidAudioManager: ObservableObject {
         // Step 2: Perform diarization to identify speakers and segments
         let diarizationResult = try diarizer.performCompleteDiarization(audioSamples, sampleRate: config.sampleRate)
         
-        // Step 3: Convert diarization segments to our format
-        let segments = diarizationResult.segments.map { segment in
-            let startSample = Int(Double(segment.startTimeSeconds) * Double(config.sampleRate))
-            let endSample = min(Int(Double(segment.endTimeSeconds) * Double(config.sampleRate)), audioSamples.count)
+        // Step 3: Coalesce consecutive turns of the same speaker. Whisper pads every input to a 30s
+        // window, so transcribing each short fragment separately re-encodes mostly-padding windows
+        let turns = coalesceSpeakerTurns(diarizationResult.segments)
+        
+        // Step 4: Convert speaker turns to our format, collecting speaker IDs in the same pass
+        var speakerIds = Set<String>()
+        let segments = turns.map { turn in
+            speakerIds.insert(turn.speakerId)
+            let endSample = min(Int(turn.endTime * Double(config.sampleRate)), audioSamples.count)
+            let startSample = min(Int(turn.startTime * Double(config.sampleRate)), endSample)
             let segmentSamples = Array(audioSamples[startSample..<endSample])
             
             return ProcessedSegment(
-                speakerId: segment.speakerId,
+                speakerId: turn.speakerId,
                 audioSamples: segmentSamples,
-                startTime: Double(segment.startTimeSeconds),
-                endTime: Double(segment.endTimeSeconds)
+                startTime: turn.startTime,
+                endTime: turn.endTime
             )
         }
         
         let processingTime = Date().timeIntervalSince(startTime)
-        let uniqueSpeakers = Set(segments.map { $0.speakerId }).count
+        let uniqueSpeakers = speakerIds.count
         
         print("✅ Audio processing complete in \(String(format: "%.2f", processingTime))s")
-        print("   Segments: \(segments.count)")
+        print("   Segments: \(segments.count) (from \(diarizationResult.segments.count) diarization turns)")
         print("   Speakers: \(uniqueSpeakers)")
         
         return segments
     }
     
+    private struct SpeakerTurn {
+        let speakerId: String
+        let startTime: Double
+        var endTime: Double
+    }
+    
+    // Merge back-to-back segments from the same speaker while the gap stays short and the
+    // merged turn still fits in a single 30s Whisper window
+    private func coalesceSpeakerTurns(_ segments: [TimedSpeakerSegment]) -> [SpeakerTurn] {
+        let maxGap = 1.0
+        let maxTurnDuration = 30.0
+        
+        var turns: [SpeakerTurn] = []
+        turns.reserveCapacity(segments.count)
+        
+        for segment in segments.sorted(by: { $0.startTimeSeconds < $1.startTimeSeconds }) {
+            let startTime = Double(segment.startTimeSeconds)
+            let endTime = Double(segment.endTimeSeconds)
+            
+            if var last = turns.last,
+               last.speakerId == segment.speakerId,
+               startTime - last.endTime <= maxGap,
+               endTime - last.startTime <= maxTurnDuration {
+                last.endTime = max(last.endTime, endTime)
+                turns[turns.count - 1] = last
+            } else {
+                turns.append(SpeakerTurn(speakerId: segment.speakerId, startTime: startTime, endTime: endTime))
+            }
+        }
+        
+        return turns
+    }
+    
     // MARK: - Real-time Processing
     // Note: Real-time processing will be implemented in a future version
 
@@ -216,16 +288,23 @@ public class FluidAudioManager: ObservableObject {
 
         print("🎙️ Performing Voice Activity Detection...")
         
+        guard !audioSamples.isEmpty else {
+            print("🔇 No audio samples to analyze")
+            return false
+        }
+        
         // Debug: Check first few samples to verify they're in correct range
-        if audioSamples.count > 10 {
+        if config.debugLogging && audioSamples.count > 10 {
             let firstSamples = audioSamples.prefix(10).map { String(format: "%.4f", $0) }.joined(separator: ", ")
             print("🔍 First 10 samples: [\(firstSamples)]")
         }
         
         // Debug: Check actual audio levels and characteristics
-        let maxAmplitude = audioSamples.map { abs($0) }.max() ?? 0
-        let avgAmplitude = audioSamples.map { abs($0) }.reduce(0, +) / Float(audioSamples.count)
-        let clippedSamples = audioSamples.filter { abs($0) >= 0.99 }.count
+        // Compute the magnitudes once and derive every level statistic from that single pass
+        let magnitudes = vDSP.absolute(audioSamples)
+        let maxAmplitude = vDSP.maximum(magnitudes)
+        let avgAmplitude = vDSP.mean(magnitudes)
+        let clippedSamples = magnitudes.reduce(0) { $1 >= 0.99 ? $0 + 1 : $0 }
         let clippingRatio = Float(clippedSamples) / Float(audioSamples.count)
         
         print("📊 Audio Analysis:")
@@ -243,7 +322,7 @@ public class FluidAudioManager: ObservableObject {
         var processedSamples = audioSamples
         if clippingRatio > 0.01 {  // More than 1% clipping
             print("⚠️ Audio is clipping! Scaling down by 0.7 to prevent distortion")
-            processedSamples = audioSamples.map { $0 * 0.7 }
+            processedSamples = vDSP.multiply(0.7, audioSamples)
         }
         
         // Additional diagnostics: check frequency content
@@ -283,7 +362,7 @@ public class FluidAudioManager: ObservableObject {
                 let vadResult = try await vadManager.processChunk(paddedChunk)
                 
                 // Debug first few chunks and any with significant probability
-                if chunksProcessed < 5 || vadResult.probability > 0.05 {
+                if config.debugLogging && (chunksProcessed < 5 || vadResult.probability > 0.05) {
                     let chunkMax = chunk.map { abs($0) }.max() ?? 0
                     let chunkAvg = chunk.reduce(0) { $0 + abs($1) } / Float(chunk.count)
                     // Also show first few samples of the chunk to debug
@@ -417,8 +496,10 @@ public class FluidAudioManager: ObservableObject {
             }
             
             print("✅ VAD Segmentation: Detected \(segments.count) voice segments")
-            for (index, segment) in segments.enumerated() {
-                print("   Segment \(index + 1): \(String(format: "%.2f", segment.startTime))s - \(String(format: "%.2f", segment.endTime))s (confidence: \(String(format: "%.2f", segment.confidence)))")
+            if config.debugLogging {
+                for (index, segment) in segments.enumerated() {
+                    print("   Segment \(index + 1): \(String(format: "%.2f", segment.startTime))s - \(String(format: "%.2f", segment.endTime))s (confidence: \(String(format: "%.2f", segment.confidence)))")
+                }
             }
             
             return segments
@@ -588,21 +669,27 @@ public class FluidAudioManager: ObservableObject {
         return resampledSamples
     }
 
-    private func convertDiarizationResult(_ result: DiarizationResult) -> [FluidAudioSpeakerSegment] {
+    private func convertDiarizationResult(_ result: DiarizationResult) -> (segments: [FluidAudioSpeakerSegment], totalSpeakers: Int) {
         // Convert FluidAudio's result format to our internal format
         print("🔄 Converting FluidAudio diarization result with \(result.segments.count) segments")
 
-        let segments = result.segments.map { segment in
-            FluidAudioSpeakerSegment(
+        // Count distinct speakers while converting instead of walking the segments again afterwards
+        var speakerIds = Set<String>()
+        var segments: [FluidAudioSpeakerSegment] = []
+        segments.reserveCapacity(result.segments.count)
+
+        for segment in result.segments {
+            speakerIds.insert(segment.speakerId)
+            segments.append(FluidAudioSpeakerSegment(
                 speakerId: segment.speakerId,
                 startTime: Double(segment.startTimeSeconds),
                 endTime: Double(segment.endTimeSeconds),
                 confidence: Double(segment.qualityScore)
-            )
+            ))
         }
 
         print("✅ Converted \(segments.count) FluidAudio segments")
-        return segments
+        return (segments, speakerIds.count)
     }
 
 
@@ -709,12 +796,3 @@ public enum FluidAudioError: Error, LocalizedError {
         }
     }
 }
-
-// MARK: - Extensions
-
-extension Array where Element: Hashable {
-    func uniqued() -> [Element] {
-        var seen: Set<Element> = []
-        return filter { seen.insert($0).inserted }
-    }
-}
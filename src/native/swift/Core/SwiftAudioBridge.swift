@@ -6,6 +6,10 @@ import AVFoundation
     private let processor: UnifiedAudioProcessor
     private var isInitialized = false
 
+    // The FFI caller blocks on a semaphore until processing finishes, so run the work at
+    // user-initiated QoS to keep it on the performance cores rather than the efficiency cluster
+    private static let processingPriority: TaskPriority = .userInitiated
+
     @objc public override init() {
         // Initialize with default configuration
         // Configuration can be customized through methods later
@@ -13,7 +17,14 @@ import AVFoundation
             enableRealTime: false, // Start with batch processing
             enableSpeakerDiarization: true,
             whisperModel: .base, // Balanced performance
-            outputFormat: .speakerSegmented
+            whisperWorkerCount: nil, // Scale concurrent decoding windows to installed memory
+            enableVADChunking: false, // Keep WhisperKit's sequential windowing and its segment boundaries
+            outputFormat: .speakerSegmented,
+            diarizationConfig: FluidAudioManager.Configuration(
+                allowLowPrecisionGPU: true, // FP16 GPU accumulation for faster diarization
+                prewarm: true, // Pay CoreML specialization during initialization, not on the first request
+                debugLogging: false // Set to true to print per-chunk VAD diagnostics
+            )
         )
 
         self.processor = UnifiedAudioProcessor(configuration: config)
@@ -36,7 +47,7 @@ import AVFoundation
         let semaphore = DispatchSemaphore(value: 0)
         var initSuccess = false
 
-        Task {
+        Task(priority: Self.processingPriority) {
             do {
                 try await processor.initialize()
                 initSuccess = true
@@ -76,7 +87,7 @@ import AVFoundation
         var result: UnifiedProcessingResult?
         var processingError: Error?
 
-        Task {
+        Task(priority: Self.processingPriority) {
             do {
                 result = try await processor.processAudioFile(path: filePath)
             } catch {
@@ -133,7 +144,7 @@ import AVFoundation
             var result: UnifiedProcessingResult?
             var processingError: Error?
 
-            Task {
+            Task(priority: Self.processingPriority) {
                 do {
                     result = try await processor.processAudioBuffer(buffer)
                 } catch {
@@ -268,8 +279,8 @@ import AVFoundation
             // For mono audio, just copy directly
             if channels == 1 {
                 let channelData = buffer.floatChannelData![0]
-                for frame in 0..<frameCount {
-                    channelData[frame] = floatBytes[frame]
+                if let floatBase = floatBytes.baseAddress {
+                    channelData.update(from: floatBase, count: frameCount)
                 }
             } else {
                 // For multi-channel, deinterleave
@@ -317,7 +328,8 @@ import AVFoundation
 
     private func convertToJSON(_ object: [String: Any]) -> String? {
         do {
-            let jsonData = try JSONSerialization.data(withJSONObject: object, options: [.prettyPrinted])
+            // Compact output: no indentation whitespace to generate, copy through the C buffer, or parse
+            let jsonData = try JSONSerialization.data(withJSONObject: object, options: [])
             return String(data: jsonData, encoding: .utf8)
         } catch {
             print("❌ JSON serialization failed: \(error)")
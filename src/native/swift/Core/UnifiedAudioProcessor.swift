@@ -1,5 +1,6 @@
 import Foundation
 import AVFoundation
+import Accelerate
 
 @available(macOS 14.0, *)
 public class UnifiedAudioProcessor: ObservableObject {
@@ -12,16 +13,25 @@ public class UnifiedAudioProcessor: ObservableObject {
         let enableRealTime: Bool
         let enableSpeakerDiarization: Bool
         let whisperModel: WhisperKitManager.ModelType
+        let whisperWorkerCount: Int?  // nil picks WhisperKitManager.defaultConcurrentWorkerCount()
+        let enableVADChunking: Bool  // Split >30s inputs into concurrently decoded windows
         let outputFormat: OutputFormat
+        let diarizationConfig: FluidAudioManager.Configuration  // GPU precision, prewarm and VAD debug logging
 
         public init(enableRealTime: Bool = false,
                     enableSpeakerDiarization: Bool = true,
                     whisperModel: WhisperKitManager.ModelType = .base,
-                    outputFormat: OutputFormat = .segmented) {
+                    whisperWorkerCount: Int? = nil,
+                    enableVADChunking: Bool = false,
+                    outputFormat: OutputFormat = .segmented,
+                    diarizationConfig: FluidAudioManager.Configuration = .default) {
             self.enableRealTime = enableRealTime
             self.enableSpeakerDiarization = enableSpeakerDiarization
             self.whisperModel = whisperModel
+            self.whisperWorkerCount = whisperWorkerCount
+            self.enableVADChunking = enableVADChunking
             self.outputFormat = outputFormat
+            self.diarizationConfig = diarizationConfig
         }
 
         public static let `default` = ProcessingConfig()
@@ -41,8 +51,12 @@ public class UnifiedAudioProcessor: ObservableObject {
         self.config = configuration
 
         // Initialize managers with appropriate configurations
-        self.whisperKit = WhisperKitManager(modelType: configuration.whisperModel)
-        self.fluidAudio = FluidAudioManager(configuration: .default)
+        self.whisperKit = WhisperKitManager(
+            modelType: configuration.whisperModel,
+            concurrentWorkerCount: configuration.whisperWorkerCount,
+            enableVADChunking: configuration.enableVADChunking
+        )
+        self.fluidAudio = FluidAudioManager(configuration: configuration.diarizationConfig)
         self.audioCapture = AudioCapture()
 
         print("🎯 UnifiedAudioProcessor initialized")
@@ -109,16 +123,22 @@ public class UnifiedAudioProcessor: ObservableObject {
         print("🎵 Starting unified audio processing for: \(URL(fileURLWithPath: path).lastPathComponent)")
 
         do {
-            // Step 1: Perform transcription
-            print("1️⃣ Running transcription...")
-            let transcriptionResult = try await whisperKit.transcribeAudio(audioPath: path)
-
             var speakerSegments: [UnifiedSpeakerSegment] = []
+            let transcriptionResult: WhisperKitTranscriptionResult
 
-            // Step 2: Perform speaker diarization if enabled
             if config.enableSpeakerDiarization {
+                // Decode the file once (WhisperKit's resampling loader, 16kHz mono) and share the
+                // samples between WhisperKit and FluidAudio
+                print("0️⃣ Decoding audio file...")
+                let audioSamples = try whisperKit.loadAudioSamples(path: path)
+
+                // Step 1: Perform transcription
+                print("1️⃣ Running transcription...")
+                transcriptionResult = try await whisperKit.transcribeAudioSamples(audioSamples)
+
+                // Step 2: Perform speaker diarization
                 print("2️⃣ Running speaker diarization...")
-                let diarizationResult = try await fluidAudio.performDiarization(audioPath: path)
+                let diarizationResult = try await fluidAudio.performDiarization(audioSamples: audioSamples)
 
                 // Step 3: Merge transcription and diarization results
                 print("3️⃣ Merging results...")
@@ -127,6 +147,10 @@ public class UnifiedAudioProcessor: ObservableObject {
                     diarization: diarizationResult
                 )
             } else {
+                // Step 1: Perform transcription
+                print("1️⃣ Running transcription...")
+                transcriptionResult = try await whisperKit.transcribeAudio(audioPath: path)
+
                 // Convert transcription segments to unified format without speaker info
                 speakerSegments = transcriptionResult.segments.map { segment in
                     UnifiedSpeakerSegment(
@@ -208,11 +232,8 @@ public class UnifiedAudioProcessor: ObservableObject {
                 for (index, segment) in processedSegments.enumerated() {
                     print("   Transcribing segment \(index + 1)/\(processedSegments.count) (Speaker: \(segment.speakerId))")
                     
-                    // Convert segment audio to buffer for WhisperKit
-                    let segmentBuffer = floatArrayToBuffer(segment.audioSamples, sampleRate: 16000)
-                    
-                    // Transcribe this segment
-                    let transcriptionResult = try await whisperKit.transcribeAudioBuffer(segmentBuffer)
+                    // Transcribe the segment's 16kHz samples directly instead of round-tripping through a buffer
+                    let transcriptionResult = try await whisperKit.transcribeAudioSamples(segment.audioSamples)
                     
                     // Create unified segment with speaker and transcription
                     speakerSegments.append(UnifiedSpeakerSegment(
@@ -305,15 +326,32 @@ public class UnifiedAudioProcessor: ObservableObject {
               "with diarization (\(diarization.speakers.count) speakers)")
 
         var mergedSegments: [UnifiedSpeakerSegment] = []
+        mergedSegments.reserveCapacity(transcription.segments.count)
+
+        // Pull speaker boundaries into start-sorted parallel arrays so each lookup is a binary search
+        // instead of a linear scan over every speaker segment
+        let speakers = diarization.speakers.enumerated()
+            .sorted { ($0.element.startTime, $0.offset) < ($1.element.startTime, $1.offset) }
+            .map { $0.element }
+        let speakerStarts = speakers.map { $0.startTime }
+        var speakerMaxEnds: [Double] = []
+        speakerMaxEnds.reserveCapacity(speakers.count)
+        var runningMaxEnd = -Double.infinity
+        for speakerSegment in speakers {
+            runningMaxEnd = max(runningMaxEnd, speakerSegment.endTime)
+            speakerMaxEnds.append(runningMaxEnd)
+        }
 
         // Algorithm: For each transcription segment, find the overlapping speaker segment(s)
         for transcriptSegment in transcription.segments {
             let segmentMidpoint = (transcriptSegment.startTime + transcriptSegment.endTime) / 2
 
-            // Find the speaker segment that contains the midpoint of this transcription segment
-            let matchingSpeaker = diarization.speakers.first { speakerSegment in
-                speakerSegment.startTime <= segmentMidpoint && segmentMidpoint <= speakerSegment.endTime
-            }
+            // Find the earliest-starting speaker segment that contains the midpoint of this transcription segment:
+            // segments before `startedCount` start at or before the midpoint, and the first index whose running
+            // max end reaches the midpoint is the first of those that is still active at it
+            let startedCount = partitionIndex(speakerStarts) { $0 > segmentMidpoint }
+            let activeIndex = partitionIndex(speakerMaxEnds) { $0 >= segmentMidpoint }
+            let matchingSpeaker = activeIndex < startedCount ? speakers[activeIndex] : nil
 
             let unifiedSegment = UnifiedSpeakerSegment(
                 text: transcriptSegment.text,
@@ -348,6 +386,21 @@ public class UnifiedAudioProcessor: ObservableObject {
         return mergedSegments
     }
 
+    // Binary search for the first index where `predicate` becomes true; `values` must be partitioned by it
+    private func partitionIndex(_ values: [Double], where predicate: (Double) -> Bool) -> Int {
+        var low = 0
+        var high = values.count
+        while low < high {
+            let mid = (low + high) / 2
+            if predicate(values[mid]) {
+                high = mid
+            } else {
+                low = mid + 1
+            }
+        }
+        return low
+    }
+
     // MARK: - Utility Methods
 
     public func getSystemInfo() -> UnifiedProcessorInfo {
@@ -377,38 +430,25 @@ public class UnifiedAudioProcessor: ObservableObject {
         
         let channelCount = Int(buffer.format.channelCount)
         let frameLength = Int(buffer.frameLength)
-        var floatArray = [Float]()
         
         // If mono, just copy the data
         if channelCount == 1 {
-            floatArray = Array(UnsafeBufferPointer(start: floatData[0], count: frameLength))
-        } else {
-            // If stereo or more, mix down to mono
-            for frame in 0..<frameLength {
-                var mixedSample: Float = 0
-                for channel in 0..<channelCount {
-                    mixedSample += floatData[channel][frame]
-                }
-                floatArray.append(mixedSample / Float(channelCount))
-            }
+            return Array(UnsafeBufferPointer(start: floatData[0], count: frameLength))
         }
         
-        return floatArray
-    }
-    
-    private func floatArrayToBuffer(_ floatArray: [Float], sampleRate: Double) -> AVAudioPCMBuffer {
-        let format = AVAudioFormat(standardFormatWithSampleRate: sampleRate, channels: 1)!
-        let buffer = AVAudioPCMBuffer(pcmFormat: format, frameCapacity: AVAudioFrameCount(floatArray.count))!
+        // If stereo or more, mix down to mono (vectorized sum + scale)
+        var floatArray = [Float](repeating: 0, count: frameLength)
+        var scale = 1.0 / Float(channelCount)
         
-        buffer.frameLength = AVAudioFrameCount(floatArray.count)
-        
-        if let channelData = buffer.floatChannelData {
-            for (index, sample) in floatArray.enumerated() {
-                channelData[0][index] = sample
+        floatArray.withUnsafeMutableBufferPointer { mono in
+            guard let monoBase = mono.baseAddress else { return }
+            for channel in 0..<channelCount {
+                vDSP_vadd(monoBase, 1, floatData[channel], 1, monoBase, 1, vDSP_Length(frameLength))
             }
+            vDSP_vsmul(monoBase, 1, &scale, monoBase, 1, vDSP_Length(frameLength))
         }
         
-        return buffer
+        return floatArray
     }
 
     // MARK: - Cleanup
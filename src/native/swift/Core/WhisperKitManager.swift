@@ -6,8 +6,13 @@ import AVFoundation
 public class WhisperKitManager: ObservableObject {
     private var whisperKit: WhisperKit?
     private let config: WhisperKitConfig
+    private let decodingOptions: DecodingOptions
+    private let enableVADChunking: Bool
     private var isInitialized = false
 
+    // Whisper decodes 30s windows; only inputs longer than one window benefit from chunking
+    private static let windowSampleCount = 16000 * 30
+
     // Supported models for different use cases
     public enum ModelType: String, CaseIterable {
         case tiny = "openai_whisper-tiny"
@@ -37,20 +42,63 @@ public class WhisperKitManager: ObservableObject {
         }
     }
 
-    public init(modelType: ModelType = .base) {
+    // Number of 30s windows decoded concurrently. More workers keep the ANE/GPU busier on long
+    // recordings but each holds its own decoder state, so memory grows with the count.
+    // 16 matches WhisperKit's own macOS default; only machines under 12GB are scaled down.
+    public static func defaultConcurrentWorkerCount() -> Int {
+        let physicalMemory = ProcessInfo.processInfo.physicalMemory
+        return physicalMemory < 12_000_000_000 ? 4 : 16
+    }
+
+    // enableVADChunking (opt-in) splits inputs longer than 30s at silences into independent windows
+    // that are decoded concurrently. It changes transcript text and segment boundaries, and the
+    // worker count only has an effect when chunking is used
+    public init(modelType: ModelType = .base, concurrentWorkerCount: Int? = nil, enableVADChunking: Bool = false) {
         print("🎤 Initializing WhisperKitManager with model: \(modelType.displayName)")
 
+        var options = DecodingOptions()
+        options.concurrentWorkerCount = concurrentWorkerCount ?? Self.defaultConcurrentWorkerCount()
+        self.decodingOptions = options
+        self.enableVADChunking = enableVADChunking
+        print("   VAD chunking (>30s inputs): \(enableVADChunking)")
+        print("   Concurrent workers: \(options.concurrentWorkerCount)")
+
+        // Point straight at an already-downloaded model so startup skips the Hub round-trip
+        // (which stalls until the network times out when offline)
+        let cachedFolder = Self.cachedModelFolder(for: modelType)
+        if let cachedFolder = cachedFolder {
+            print("   Using cached model: \(cachedFolder)")
+        }
+
         self.config = WhisperKitConfig(
             model: modelType.rawValue,
+            modelFolder: cachedFolder,
             computeOptions: ModelComputeOptions(), // Use default compute options
             verbose: true,
             logLevel: .info,
             prewarm: true,
             load: false, // We'll load manually for better control
-            download: true // Auto-download if needed
+            download: cachedFolder == nil // Auto-download only if not cached
         )
     }
 
+    // Locate a complete model in WhisperKit's default download location, if present
+    private static func cachedModelFolder(for modelType: ModelType) -> String? {
+        guard let documents = FileManager.default.urls(for: .documentDirectory, in: .userDomainMask).first else {
+            return nil
+        }
+
+        let modelFolder = documents
+            .appendingPathComponent("huggingface/models/argmaxinc/whisperkit-coreml")
+            .appendingPathComponent(modelType.rawValue)
+        let requiredModels = ["MelSpectrogram.mlmodelc", "AudioEncoder.mlmodelc", "TextDecoder.mlmodelc"]
+
+        let isComplete = requiredModels.allSatisfy { model in
+            FileManager.default.fileExists(atPath: modelFolder.appendingPathComponent(model).path)
+        }
+        return isComplete ? modelFolder.path : nil
+    }
+
     // MARK: - Initialization
 
     public func initialize() async throws {
@@ -95,93 +143,97 @@ public class WhisperKitManager: ObservableObject {
         }
     }
 
+    // MARK: - Audio Loading
+
+    // Decode a file to mono 16kHz samples with WhisperKit's AVAudioConverter-based loader, so callers
+    // can decode once and hand the same samples to other engines (e.g. FluidAudio)
+    public func loadAudioSamples(path: String) throws -> [Float] {
+        do {
+            return try AudioProcessor.loadAudioAsFloatArray(fromPath: path)
+        } catch {
+            print("❌ Failed to load audio file: \(error)")
+            throw WhisperKitError.transcriptionFailed("Failed to load audio file: \(error.localizedDescription)")
+        }
+    }
+
     // MARK: - Transcription Methods
 
     public func transcribeAudio(audioPath: String) async throws -> WhisperKitTranscriptionResult {
-        guard isInitialized, let whisperKit = whisperKit else {
+        guard isInitialized else {
             throw WhisperKitError.notInitialized
         }
 
         print("🎵 Starting transcription for: \(URL(fileURLWithPath: audioPath).lastPathComponent)")
 
-        do {
-            let audioURL = URL(fileURLWithPath: audioPath)
-
-            // Perform transcription
-            let results = try await whisperKit.transcribe(audioPath: audioURL.path)
-
-            guard let transcriptionResult = results.first else {
-                throw WhisperKitError.transcriptionFailed("No transcription result returned")
-            }
+        // Decode with the same loader WhisperKit uses for paths, so the input length is known
+        // when choosing decoding options
+        return try await transcribeAudioSamples(loadAudioSamples(path: audioPath))
+    }
 
-            // Convert to our result format
-            let ourResult = WhisperKitTranscriptionResult(
-                text: transcriptionResult.text,
-                language: transcriptionResult.language,
-                segments: transcriptionResult.segments.map { segment in
-                    WhisperKitSegment(
-                        text: segment.text,
-                        startTime: Double(segment.start),
-                        endTime: Double(segment.end),
-                        confidence: Double(segment.avgLogprob)
-                    )
-                },
-                processingTime: 0.0, // WhisperKit doesn't provide this directly
-                success: true
-            )
-
-            print("✅ Transcription completed: \(transcriptionResult.text.count) characters")
-            return ourResult
+    public func transcribeAudioBuffer(_ buffer: AVAudioPCMBuffer) async throws -> WhisperKitTranscriptionResult {
+        print("🎵 Starting buffer transcription...")
 
-        } catch {
-            print("❌ Transcription failed: \(error)")
-            throw WhisperKitError.transcriptionFailed(error.localizedDescription)
-        }
+        // Convert buffer to the format WhisperKit expects
+        return try await transcribeAudioSamples(bufferToFloatArray(buffer))
     }
 
-    public func transcribeAudioBuffer(_ buffer: AVAudioPCMBuffer) async throws -> WhisperKitTranscriptionResult {
+    // Transcribe mono 16kHz samples that were already decoded by the caller
+    public func transcribeAudioSamples(_ audioArray: [Float]) async throws -> WhisperKitTranscriptionResult {
         guard isInitialized, let whisperKit = whisperKit else {
             throw WhisperKitError.notInitialized
         }
 
-        print("🎵 Starting buffer transcription...")
-
         do {
-            // Convert buffer to the format WhisperKit expects
-            let audioArray = bufferToFloatArray(buffer)
-
             // Perform transcription on audio samples
-            let results = try await whisperKit.transcribe(audioArray: audioArray)
+            let options = chunkedDecodingOptions(forSampleCount: audioArray.count)
+            let results = try await whisperKit.transcribe(audioArray: audioArray, decodeOptions: options)
+            let ourResult = try convertResults(results)
 
-            guard let transcriptionResult = results.first else {
-                throw WhisperKitError.transcriptionFailed("No transcription result returned")
-            }
-
-            // Convert to our result format
-            let ourResult = WhisperKitTranscriptionResult(
-                text: transcriptionResult.text,
-                language: transcriptionResult.language,
-                segments: transcriptionResult.segments.map { segment in
-                    WhisperKitSegment(
-                        text: segment.text,
-                        startTime: Double(segment.start),
-                        endTime: Double(segment.end),
-                        confidence: Double(segment.avgLogprob)
-                    )
-                },
-                processingTime: 0.0,
-                success: true
-            )
-
-            print("✅ Buffer transcription completed: \(transcriptionResult.text.count) characters")
+            print("✅ Transcription completed: \(ourResult.text.count) characters")
             return ourResult
 
         } catch {
-            print("❌ Buffer transcription failed: \(error)")
+            print("❌ Transcription failed: \(error)")
             throw WhisperKitError.transcriptionFailed(error.localizedDescription)
         }
     }
 
+    private func chunkedDecodingOptions(forSampleCount sampleCount: Int) -> DecodingOptions {
+        var options = decodingOptions
+        if enableVADChunking && sampleCount > Self.windowSampleCount {
+            options.chunkingStrategy = .vad
+        }
+        return options
+    }
+
+    // Chunked decoding can return one result per window, so merge them all into our result format
+    private func convertResults(_ results: [TranscriptionResult]) throws -> WhisperKitTranscriptionResult {
+        guard let firstResult = results.first else {
+            throw WhisperKitError.transcriptionFailed("No transcription result returned")
+        }
+
+        // Window texts usually carry their own leading space, so trim before joining
+        let text = results
+            .map { $0.text.trimmingCharacters(in: .whitespaces) }
+            .filter { !$0.isEmpty }
+            .joined(separator: " ")
+
+        return WhisperKitTranscriptionResult(
+            text: text,
+            language: firstResult.language,
+            segments: results.flatMap { $0.segments }.map { segment in
+                WhisperKitSegment(
+                    text: segment.text,
+                    startTime: Double(segment.start),
+                    endTime: Double(segment.end),
+                    confidence: Double(segment.avgLogprob)
+                )
+            },
+            processingTime: 0.0, // WhisperKit doesn't provide this directly
+            success: true
+        )
+    }
+
     // MARK: - Real-time Streaming (Future Enhancement)
 
     public func startStreamingTranscription() async throws {
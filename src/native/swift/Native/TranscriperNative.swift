@@ -4,11 +4,50 @@ import TranscriperCore
 // Global instance to maintain state between C function calls
 private var sharedBridge: SwiftAudioBridge?
 
+// Koffi's async calls run on worker threads, so every access to sharedBridge goes through this lock
+private let sharedBridgeLock = NSLock()
+
+private func currentBridge() -> SwiftAudioBridge? {
+    sharedBridgeLock.lock()
+    defer { sharedBridgeLock.unlock() }
+    return sharedBridge
+}
+
 // C-compatible wrapper functions for the Swift audio processing pipeline
 // These functions can be called directly from Node.js via FFI
 
+// Copy a string's UTF-8 bytes straight into a caller-owned C buffer (no intermediate Data),
+// truncating to leave space for the null terminator. Returns the number of bytes written.
+private func copyToCBuffer(_ string: String, _ buffer: UnsafeMutablePointer<CChar>, _ bufferSize: Int32) -> Int32 {
+    guard bufferSize > 0 else {
+        return -1
+    }
+
+    var utf8String = string
+    let length = utf8String.withUTF8 { bytes -> Int in
+        let count = min(bytes.count, Int(bufferSize) - 1)
+        if let base = bytes.baseAddress, count > 0 {
+            UnsafeMutableRawPointer(buffer).copyMemory(from: base, byteCount: count)
+        }
+        return count
+    }
+
+    buffer[length] = 0
+    return Int32(length)
+}
+
 @_cdecl("transcriper_initialize")
 public func transcriper_initialize() -> Int32 {
+    // Hold the lock for the whole setup so concurrent callers can't build two pipelines
+    sharedBridgeLock.lock()
+    defer { sharedBridgeLock.unlock() }
+
+    // Reuse the loaded models instead of rebuilding the whole pipeline on every call
+    if let bridge = sharedBridge, bridge.isReady() {
+        print("✅ TranscriperNative already initialized, reusing loaded models")
+        return 1
+    }
+
     print("🌉 Initializing TranscriperNative for Node.js integration...")
 
     do {
@@ -35,7 +74,7 @@ public func transcriper_initialize() -> Int32 {
 
 @_cdecl("transcriper_is_ready")
 public func transcriper_is_ready() -> Int32 {
-    guard let bridge = sharedBridge else {
+    guard let bridge = currentBridge() else {
         return 0
     }
 
@@ -46,7 +85,7 @@ public func transcriper_is_ready() -> Int32 {
 public func transcriper_process_audio_file(_ filePath: UnsafePointer<CChar>,
                                            _ resultBuffer: UnsafeMutablePointer<CChar>,
                                            _ bufferSize: Int32) -> Int32 {
-    guard let bridge = sharedBridge else {
+    guard let bridge = currentBridge() else {
         print("❌ TranscriperNative not initialized")
         return -1
     }
@@ -57,23 +96,10 @@ public func transcriper_process_audio_file(_ filePath: UnsafePointer<CChar>,
     let jsonResult = bridge.processAudioFile(filePathString)
 
     // Copy result to C buffer
-    guard let resultData = jsonResult.data(using: .utf8) else {
-        print("❌ Failed to convert result to UTF8")
-        return -1
-    }
-
-    let resultLength = min(resultData.count, Int(bufferSize) - 1) // Leave space for null terminator
-
-    resultData.withUnsafeBytes { bytes in
-        let boundBytes = bytes.bindMemory(to: CChar.self)
-        resultBuffer.initialize(from: boundBytes.baseAddress!, count: resultLength)
-    }
-
-    // Add null terminator
-    resultBuffer[resultLength] = 0
+    let resultLength = copyToCBuffer(jsonResult, resultBuffer, bufferSize)
 
     print("✅ Audio file processing completed, result length: \(resultLength)")
-    return Int32(resultLength)
+    return resultLength
 }
 
 @_cdecl("transcriper_process_audio_buffer")
@@ -83,95 +109,56 @@ public func transcriper_process_audio_buffer(_ audioData: UnsafePointer<Float>,
                                              _ channels: Int32,
                                              _ resultBuffer: UnsafeMutablePointer<CChar>,
                                              _ bufferSize: Int32) -> Int32 {
-    guard let bridge = sharedBridge else {
+    guard let bridge = currentBridge() else {
         print("❌ TranscriperNative not initialized")
         return -1
     }
 
     print("🎵 Processing audio buffer via C API: \(dataLength) samples at \(sampleRate)Hz")
 
-    // Convert C array to Swift Data correctly
-    let floatArray = Array(UnsafeBufferPointer(start: audioData, count: Int(dataLength)))
-    let audioDataSwift = floatArray.withUnsafeBytes { Data($0) }
+    // Copy the C array into Swift Data in one step (no intermediate [Float])
+    let audioDataSwift = Data(bytes: audioData, count: Int(dataLength) * MemoryLayout<Float>.size)
 
     let jsonResult = bridge.processAudioBuffer(audioDataSwift, sampleRate: Int(sampleRate), channels: Int(channels))
 
     // Copy result to C buffer
-    guard let resultData = jsonResult.data(using: .utf8) else {
-        print("❌ Failed to convert buffer result to UTF8")
-        return -1
-    }
-
-    let resultLength = min(resultData.count, Int(bufferSize) - 1)
-
-    resultData.withUnsafeBytes { bytes in
-        let boundBytes = bytes.bindMemory(to: CChar.self)
-        resultBuffer.initialize(from: boundBytes.baseAddress!, count: resultLength)
-    }
-
-    resultBuffer[resultLength] = 0
+    let resultLength = copyToCBuffer(jsonResult, resultBuffer, bufferSize)
 
     print("✅ Audio buffer processing completed, result length: \(resultLength)")
-    return Int32(resultLength)
+    return resultLength
 }
 
 @_cdecl("transcriper_get_system_info")
 public func transcriper_get_system_info(_ infoBuffer: UnsafeMutablePointer<CChar>,
                                          _ bufferSize: Int32) -> Int32 {
-    guard let bridge = sharedBridge else {
+    guard let bridge = currentBridge() else {
         print("❌ TranscriperNative not initialized")
         return -1
     }
 
     let jsonInfo = bridge.getSystemInfo()
 
-    guard let infoData = jsonInfo.data(using: .utf8) else {
-        print("❌ Failed to convert system info to UTF8")
-        return -1
-    }
-
-    let infoLength = min(infoData.count, Int(bufferSize) - 1)
-
-    infoData.withUnsafeBytes { bytes in
-        let boundBytes = bytes.bindMemory(to: CChar.self)
-        infoBuffer.initialize(from: boundBytes.baseAddress!, count: infoLength)
-    }
-
-    infoBuffer[infoLength] = 0
-
-    return Int32(infoLength)
+    return copyToCBuffer(jsonInfo, infoBuffer, bufferSize)
 }
 
 @_cdecl("transcriper_get_available_models")
 public func transcriper_get_available_models(_ modelsBuffer: UnsafeMutablePointer<CChar>,
                                              _ bufferSize: Int32) -> Int32 {
-    guard let bridge = sharedBridge else {
+    guard let bridge = currentBridge() else {
         print("❌ TranscriperNative not initialized")
         return -1
     }
 
     let jsonModels = bridge.getAvailableModels()
 
-    guard let modelsData = jsonModels.data(using: .utf8) else {
-        print("❌ Failed to convert models info to UTF8")
-        return -1
-    }
-
-    let modelsLength = min(modelsData.count, Int(bufferSize) - 1)
-
-    modelsData.withUnsafeBytes { bytes in
-        let boundBytes = bytes.bindMemory(to: CChar.self)
-        modelsBuffer.initialize(from: boundBytes.baseAddress!, count: modelsLength)
-    }
-
-    modelsBuffer[modelsLength] = 0
-
-    return Int32(modelsLength)
+    return copyToCBuffer(jsonModels, modelsBuffer, bufferSize)
 }
 
 @_cdecl("transcriper_cleanup")
 public func transcriper_cleanup() {
     print("♻️ Cleaning up TranscriperNative resources...")
+    sharedBridgeLock.lock()
     sharedBridge = nil
+    sharedBridgeLock.unlock()
     print("✅ TranscriperNative cleanup complete")
 }
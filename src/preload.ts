@@ -29,9 +29,9 @@ contextBridge.exposeInMainWorld('electronAPI', {
     transcribeDualStreams: (systemAudioPath?: string, microphoneAudioPath?: string, options?: TranscriptionOptions) => ipcRenderer.invoke('transcription:transcribe-dual-streams', systemAudioPath, microphoneAudioPath, options),
     startStream: (filePath: string) => ipcRenderer.invoke('transcription:start-stream', filePath),
     processAudioBuffer: (audioData: Float32Array, sampleRate: number, channels: number) => {
-      // Convert Float32Array to regular array for IPC serialization
-      const audioArray = Array.from(audioData);
-      return ipcRenderer.invoke('transcription:process-audio-buffer', audioArray, sampleRate, channels);
+      // Typed arrays survive IPC structured cloning as a single block copy, so send the
+      // Float32Array as-is rather than boxing every sample into a plain number array
+      return ipcRenderer.invoke('transcription:process-audio-buffer', audioData, sampleRate, channels);
     },
     onProgress: (callback: (text: string) => void) => {
       ipcRenderer.on('transcription:progress', (_event, text) => callback(text));
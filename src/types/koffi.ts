@@ -13,32 +13,47 @@ export interface KoffiModule {
   decode(buffer: Buffer, type: string, length?: number): string;
 }
 
-// Swift function signatures
-export type TranscriperInitialize = (modelPath: string, modelType: string) => number;
-export type TranscriperIsReady = () => boolean;
-export type TranscriperProcessAudioFile = (
+// Koffi functions also expose an async variant that runs the native call on a worker thread
+// and reports (error, result) to a callback appended after the native arguments
+export type KoffiAsyncCallback<R> = (error: Error | null, result: R) => void;
+
+export interface KoffiAsyncFunction<A extends unknown[], R> {
+  async(...args: [...A, KoffiAsyncCallback<R>]): void;
+}
+
+// Argument lists of the native entry points that are called on the worker thread
+export type TranscriperProcessAudioFileArgs = [
   audioPath: string,
-  language: string,
-  options: string,
   resultBuffer: Buffer,
   bufferSize: number
-) => number;
-export type TranscriperProcessAudioBuffer = (
-  audioData: Buffer,
-  dataSize: number,
+];
+export type TranscriperProcessAudioBufferArgs = [
+  audioData: Float32Array,
+  dataLength: number,
   sampleRate: number,
   channels: number,
-  language: string,
-  options: string,
   resultBuffer: Buffer,
   bufferSize: number
-) => number;
-export type TranscriperGetSystemInfo = (
+];
+
+export type TranscriperGetSystemInfoArgs = [
   resultBuffer: Buffer,
   bufferSize: number
-) => number;
-export type TranscriperGetAvailableModels = (
+];
+export type TranscriperGetAvailableModelsArgs = [
   resultBuffer: Buffer,
   bufferSize: number
-) => number;
-export type TranscriperCleanup = () => void;
\ No newline at end of file
+];
+
+// Swift function signatures
+export type TranscriperInitialize = (() => number) & KoffiAsyncFunction<[], number>;
+export type TranscriperIsReady = () => boolean;
+export type TranscriperProcessAudioFile = ((...args: TranscriperProcessAudioFileArgs) => number) &
+  KoffiAsyncFunction<TranscriperProcessAudioFileArgs, number>;
+export type TranscriperProcessAudioBuffer = ((...args: TranscriperProcessAudioBufferArgs) => number) &
+  KoffiAsyncFunction<TranscriperProcessAudioBufferArgs, number>;
+export type TranscriperGetSystemInfo = ((...args: TranscriperGetSystemInfoArgs) => number) &
+  KoffiAsyncFunction<TranscriperGetSystemInfoArgs, number>;
+export type TranscriperGetAvailableModels = ((...args: TranscriperGetAvailableModelsArgs) => number) &
+  KoffiAsyncFunction<TranscriperGetAvailableModelsArgs, number>;
+export type TranscriperCleanup = () => void;
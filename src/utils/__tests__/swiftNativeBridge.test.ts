@@ -0,0 +1,121 @@
+/**
+ * Tests for SwiftNativeBridge - focusing on the native processing queue
+ */
+
+type NativeCallback = (error: Error | null, result: number) => void;
+
+interface PendingNativeCall {
+  name: string;
+  args: unknown[];
+  callback: NativeCallback;
+}
+
+// Async native calls are held here until a test completes them
+const mockPendingCalls: PendingNativeCall[] = [];
+
+const mockNativeFunction = (name: string) =>
+  Object.assign(jest.fn(() => 1), {
+    async: jest.fn((...args: unknown[]) => {
+      const callback = args.pop() as NativeCallback;
+
+      // Initialization completes straight away so tests only drive the processing calls
+      if (name === 'transcriper_initialize') {
+        callback(null, 1);
+        return;
+      }
+
+      mockPendingCalls.push({ name, args, callback });
+    })
+  });
+
+jest.mock('koffi', () => {
+  const koffiMock = {
+    load: jest.fn(() => ({
+      func: jest.fn((signature: string) => mockNativeFunction(/(\w+)\(/.exec(signature)![1]))
+    })),
+    alloc: jest.fn(() => ({})),
+    decode: jest.fn(() => '{"success":true}')
+  };
+
+  return { __esModule: true, default: koffiMock, ...koffiMock };
+});
+
+// Let queued promise callbacks run
+const flushPromises = () => new Promise(resolve => setTimeout(resolve, 0));
+
+const callsTo = (name: string) => mockPendingCalls.filter(call => call.name === name);
+const processCalls = () => callsTo('transcriper_process_audio_file');
+
+describe('SwiftNativeBridge - Processing Queue', () => {
+  let SwiftNativeBridge: typeof import('../swiftNativeBridge').SwiftNativeBridge;
+
+  beforeEach(() => {
+    mockPendingCalls.length = 0;
+    jest.clearAllMocks();
+
+    // Fresh module per test so the static library, init flag and queue start clean
+    jest.isolateModules(() => {
+      ({ SwiftNativeBridge } = require('../swiftNativeBridge'));
+    });
+  });
+
+  it('should run processing requests one at a time in FIFO order', async () => {
+    const first = SwiftNativeBridge.processAudioFile('/tmp/first.wav');
+    const second = SwiftNativeBridge.processAudioFile('/tmp/second.wav');
+
+    await flushPromises();
+
+    // The second request must not reach the native side while the first is still running
+    expect(processCalls()).toHaveLength(1);
+    expect(processCalls()[0].args[0]).toBe('/tmp/first.wav');
+
+    processCalls()[0].callback(null, 16);
+    await flushPromises();
+
+    expect(processCalls()).toHaveLength(2);
+    expect(processCalls()[1].args[0]).toBe('/tmp/second.wav');
+
+    processCalls()[1].callback(null, 16);
+
+    await expect(first).resolves.toEqual({ success: true, data: { success: true } });
+    await expect(second).resolves.toEqual({ success: true, data: { success: true } });
+  });
+
+  it('should keep processing after a queued request fails', async () => {
+    const first = SwiftNativeBridge.processAudioFile('/tmp/first.wav');
+    const second = SwiftNativeBridge.processAudioFile('/tmp/second.wav');
+
+    await flushPromises();
+    processCalls()[0].callback(new Error('native crash'), 0);
+
+    await expect(first).rejects.toThrow('native crash');
+    await flushPromises();
+
+    expect(processCalls()).toHaveLength(2);
+    expect(processCalls()[1].args[0]).toBe('/tmp/second.wav');
+
+    processCalls()[1].callback(null, 16);
+
+    await expect(second).resolves.toEqual({ success: true, data: { success: true } });
+  });
+
+  it('should hold system info queries until queued processing finishes', async () => {
+    const processing = SwiftNativeBridge.processAudioFile('/tmp/first.wav');
+    await flushPromises();
+
+    const systemInfo = SwiftNativeBridge.runCommand({ command: ['system-info'] });
+    await flushPromises();
+
+    // Reading pipeline state must not overlap the worker thread that is mutating it
+    expect(callsTo('transcriper_get_system_info')).toHaveLength(0);
+
+    processCalls()[0].callback(null, 16);
+    await expect(processing).resolves.toEqual({ success: true, data: { success: true } });
+    await flushPromises();
+
+    expect(callsTo('transcriper_get_system_info')).toHaveLength(1);
+    callsTo('transcriper_get_system_info')[0].callback(null, 16);
+
+    await expect(systemInfo).resolves.toEqual({ success: true, data: { success: true } });
+  });
+});
@@ -2,6 +2,7 @@ import koffi from 'koffi';
 import * as path from 'path';
 import type {
   KoffiLib,
+  KoffiAsyncFunction,
   TranscriperInitialize,
   TranscriperIsReady,
   TranscriperProcessAudioFile,
@@ -29,6 +30,15 @@ export class SwiftNativeBridge {
   private static isInitialized = false;
   private static readonly BUFFER_SIZE = 1024 * 1024; // 1MB result buffer
 
+  // The Swift pipeline is a single shared instance that rejects overlapping calls, so every native
+  // call after loading waits its turn here and runs on a koffi worker thread instead of blocking
+  // the main process
+  private static processingQueue: Promise<unknown> = Promise.resolve();
+
+  // Queued calls never overlap, so they can share one result buffer instead of allocating a
+  // fresh 1MB buffer per request
+  private static processingResultBuffer: Buffer | null = null;
+
   // Function type definitions
   private static transcriper_initialize: TranscriperInitialize | null = null;
   private static transcriper_is_ready: TranscriperIsReady | null = null;
@@ -83,13 +93,13 @@ export class SwiftNativeBridge {
     
     try {
       // Load function definitions using C-style signatures
-      SwiftNativeBridge.transcriper_initialize = SwiftNativeBridge.lib.func('int32 transcriper_initialize()');
-      SwiftNativeBridge.transcriper_is_ready = SwiftNativeBridge.lib.func('int32 transcriper_is_ready()');
-      SwiftNativeBridge.transcriper_process_audio_file = SwiftNativeBridge.lib.func('int32 transcriper_process_audio_file(str filename, _Out_ char *result, int32 bufferSize)');
-      SwiftNativeBridge.transcriper_process_audio_buffer = SwiftNativeBridge.lib.func('int32 transcriper_process_audio_buffer(const float *audioData, int32 dataLength, int32 sampleRate, int32 channels, _Out_ char *result, int32 bufferSize)');
-      SwiftNativeBridge.transcriper_get_system_info = SwiftNativeBridge.lib.func('int32 transcriper_get_system_info(_Out_ char *info, int32 bufferSize)');
-      SwiftNativeBridge.transcriper_get_available_models = SwiftNativeBridge.lib.func('int32 transcriper_get_available_models(_Out_ char *models, int32 bufferSize)');
-      SwiftNativeBridge.transcriper_cleanup = SwiftNativeBridge.lib.func('void transcriper_cleanup()');
+      SwiftNativeBridge.transcriper_initialize = SwiftNativeBridge.lib.func('int32 transcriper_initialize()') as TranscriperInitialize;
+      SwiftNativeBridge.transcriper_is_ready = SwiftNativeBridge.lib.func('int32 transcriper_is_ready()') as TranscriperIsReady;
+      SwiftNativeBridge.transcriper_process_audio_file = SwiftNativeBridge.lib.func('int32 transcriper_process_audio_file(str filename, _Out_ char *result, int32 bufferSize)') as TranscriperProcessAudioFile;
+      SwiftNativeBridge.transcriper_process_audio_buffer = SwiftNativeBridge.lib.func('int32 transcriper_process_audio_buffer(const float *audioData, int32 dataLength, int32 sampleRate, int32 channels, _Out_ char *result, int32 bufferSize)') as TranscriperProcessAudioBuffer;
+      SwiftNativeBridge.transcriper_get_system_info = SwiftNativeBridge.lib.func('int32 transcriper_get_system_info(_Out_ char *info, int32 bufferSize)') as TranscriperGetSystemInfo;
+      SwiftNativeBridge.transcriper_get_available_models = SwiftNativeBridge.lib.func('int32 transcriper_get_available_models(_Out_ char *models, int32 bufferSize)') as TranscriperGetAvailableModels;
+      SwiftNativeBridge.transcriper_cleanup = SwiftNativeBridge.lib.func('void transcriper_cleanup()') as TranscriperCleanup;
 
       console.log('🌉 Swift native library loaded successfully from:', libPath);
     } catch (error) {
@@ -147,13 +157,19 @@ export class SwiftNativeBridge {
       return { success: true };
     }
 
-    const result = SwiftNativeBridge.transcriper_initialize!();
-    SwiftNativeBridge.isInitialized = result === 1;
+    // Model loading and diarizer prewarm take seconds, so run them on a koffi worker thread.
+    // Queueing keeps concurrent callers from initializing twice and holds processing until ready
+    return SwiftNativeBridge.enqueue(async () => {
+      if (!SwiftNativeBridge.isInitialized) {
+        const result = await SwiftNativeBridge.callAsync(SwiftNativeBridge.transcriper_initialize!);
+        SwiftNativeBridge.isInitialized = result === 1;
+      }
 
-    return {
-      success: SwiftNativeBridge.isInitialized,
-      error: SwiftNativeBridge.isInitialized ? undefined : 'Swift initialization failed'
-    };
+      return {
+        success: SwiftNativeBridge.isInitialized,
+        error: SwiftNativeBridge.isInitialized ? undefined : 'Swift initialization failed'
+      };
+    });
   }
 
   static async processAudioFile(filePath: string): Promise<SwiftCommandResult> {
@@ -166,34 +182,38 @@ export class SwiftNativeBridge {
       }
     }
 
-    const resultBuffer = koffi.alloc('char', SwiftNativeBridge.BUFFER_SIZE);
-    const resultLength = SwiftNativeBridge.transcriper_process_audio_file!(
-      filePath,
-      resultBuffer,
-      SwiftNativeBridge.BUFFER_SIZE
-    );
-
-    if (resultLength <= 0) {
-      return {
-        success: false,
-        error: 'Swift audio file processing failed'
-      };
-    }
+    return SwiftNativeBridge.enqueue(async () => {
+      const resultBuffer = SwiftNativeBridge.getProcessingResultBuffer();
+      const resultLength = await SwiftNativeBridge.callAsync(
+        SwiftNativeBridge.transcriper_process_audio_file!,
+        filePath,
+        resultBuffer,
+        SwiftNativeBridge.BUFFER_SIZE
+      );
+
+      if (resultLength <= 0) {
+        return {
+          success: false,
+          error: 'Swift audio file processing failed'
+        };
+      }
 
-    try {
-      const jsonString = koffi.decode(resultBuffer, 'char', -1);
-      const parsedResult = JSON.parse(jsonString);
-      
-      return {
-        success: true,
-        data: parsedResult
-      };
-    } catch (error) {
-      return {
-        success: false,
-        error: `Failed to parse Swift result: ${error.message}`
-      };
-    }
+      try {
+        // The native side reports the byte length, so decode exactly that instead of scanning for NUL
+        const jsonString = koffi.decode(resultBuffer, 'char', resultLength);
+        const parsedResult = JSON.parse(jsonString);
+        
+        return {
+          success: true,
+          data: parsedResult
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: `Failed to parse Swift result: ${error.message}`
+        };
+      }
+    });
   }
 
   static async processAudioBuffer(audioData: Float32Array, sampleRate: number, channels: number): Promise<SwiftCommandResult> {
@@ -206,39 +226,74 @@ export class SwiftNativeBridge {
       }
     }
 
-    const resultBuffer = koffi.alloc('char', SwiftNativeBridge.BUFFER_SIZE);
+    return SwiftNativeBridge.enqueue(async () => {
+      const resultBuffer = SwiftNativeBridge.getProcessingResultBuffer();
+
+      // Koffi can handle Float32Array directly as pointer argument
+      const resultLength = await SwiftNativeBridge.callAsync(
+        SwiftNativeBridge.transcriper_process_audio_buffer!,
+        audioData,
+        audioData.length,
+        sampleRate,
+        channels,
+        resultBuffer,
+        SwiftNativeBridge.BUFFER_SIZE
+      );
+
+      if (resultLength <= 0) {
+        return {
+          success: false,
+          error: 'Swift audio buffer processing failed'
+        };
+      }
 
-    // Koffi can handle Float32Array directly as pointer argument
-    const resultLength = SwiftNativeBridge.transcriper_process_audio_buffer!(
-      audioData,
-      audioData.length,
-      sampleRate,
-      channels,
-      resultBuffer,
-      SwiftNativeBridge.BUFFER_SIZE
-    );
+      try {
+        // The native side reports the byte length, so decode exactly that instead of scanning for NUL
+        const jsonString = koffi.decode(resultBuffer, 'char', resultLength);
+        const parsedResult = JSON.parse(jsonString);
+        
+        return {
+          success: true,
+          data: parsedResult
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: `Failed to parse Swift buffer result: ${error.message}`
+        };
+      }
+    });
+  }
 
-    if (resultLength <= 0) {
-      return {
-        success: false,
-        error: 'Swift audio buffer processing failed'
-      };
+  private static getProcessingResultBuffer(): Buffer {
+    if (!SwiftNativeBridge.processingResultBuffer) {
+      SwiftNativeBridge.processingResultBuffer = koffi.alloc('char', SwiftNativeBridge.BUFFER_SIZE);
     }
+    return SwiftNativeBridge.processingResultBuffer;
+  }
 
-    try {
-      const jsonString = koffi.decode(resultBuffer, 'char', -1);
-      const parsedResult = JSON.parse(jsonString);
-      
-      return {
-        success: true,
-        data: parsedResult
-      };
-    } catch (error) {
-      return {
-        success: false,
-        error: `Failed to parse Swift buffer result: ${error.message}`
-      };
-    }
+  /**
+   * Run a native processing task after every previously queued one has settled
+   */
+  private static enqueue<T>(task: () => Promise<T>): Promise<T> {
+    const run = SwiftNativeBridge.processingQueue.then(task, task);
+    SwiftNativeBridge.processingQueue = run.catch(() => undefined);
+    return run;
+  }
+
+  /**
+   * Invoke a koffi function on its worker thread and resolve with the native return value
+   */
+  private static callAsync<A extends unknown[], R>(fn: KoffiAsyncFunction<A, R>, ...args: A): Promise<R> {
+    return new Promise((resolve, reject) => {
+      fn.async(...args, (error: Error | null, result: R) => {
+        if (error) {
+          reject(error);
+        } else {
+          resolve(result);
+        }
+      });
+    });
   }
 
   private static async getSystemInfo(): Promise<SwiftCommandResult> {
@@ -251,33 +306,38 @@ export class SwiftNativeBridge {
       }
     }
 
-    const infoBuffer = koffi.alloc('char', SwiftNativeBridge.BUFFER_SIZE);
-    const resultLength = SwiftNativeBridge.transcriper_get_system_info!(
-      infoBuffer,
-      SwiftNativeBridge.BUFFER_SIZE
-    );
-
-    if (resultLength <= 0) {
-      return {
-        success: false,
-        error: 'Swift system info failed'
-      };
-    }
+    // Info calls read pipeline state that a queued worker-thread call may be mutating, so they
+    // take their turn in the same queue
+    return SwiftNativeBridge.enqueue(async () => {
+      const infoBuffer = SwiftNativeBridge.getProcessingResultBuffer();
+      const resultLength = await SwiftNativeBridge.callAsync(
+        SwiftNativeBridge.transcriper_get_system_info!,
+        infoBuffer,
+        SwiftNativeBridge.BUFFER_SIZE
+      );
+
+      if (resultLength <= 0) {
+        return {
+          success: false,
+          error: 'Swift system info failed'
+        };
+      }
 
-    try {
-      const jsonString = koffi.decode(infoBuffer, 'char', -1);
-      const systemInfo = JSON.parse(jsonString);
+      try {
+        const jsonString = koffi.decode(infoBuffer, 'char', resultLength);
+        const systemInfo = JSON.parse(jsonString);
       
-      return {
-        success: true,
-        data: systemInfo
-      };
-    } catch (error) {
-      return {
-        success: false,
-        error: `Failed to parse system info: ${error.message}`
-      };
-    }
+        return {
+          success: true,
+          data: systemInfo
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: `Failed to parse system info: ${error.message}`
+        };
+      }
+    });
   }
 
   private static async getAvailableModels(): Promise<SwiftCommandResult> {
@@ -290,33 +350,36 @@ export class SwiftNativeBridge {
       }
     }
 
-    const modelsBuffer = koffi.alloc('char', SwiftNativeBridge.BUFFER_SIZE);
-    const resultLength = SwiftNativeBridge.transcriper_get_available_models!(
-      modelsBuffer,
-      SwiftNativeBridge.BUFFER_SIZE
-    );
-
-    if (resultLength <= 0) {
-      return {
-        success: false,
-        error: 'Swift models query failed'
-      };
-    }
+    return SwiftNativeBridge.enqueue(async () => {
+      const modelsBuffer = SwiftNativeBridge.getProcessingResultBuffer();
+      const resultLength = await SwiftNativeBridge.callAsync(
+        SwiftNativeBridge.transcriper_get_available_models!,
+        modelsBuffer,
+        SwiftNativeBridge.BUFFER_SIZE
+      );
+
+      if (resultLength <= 0) {
+        return {
+          success: false,
+          error: 'Swift models query failed'
+        };
+      }
 
-    try {
-      const jsonString = koffi.decode(modelsBuffer, 'char', -1);
-      const modelsInfo = JSON.parse(jsonString);
+      try {
+        const jsonString = koffi.decode(modelsBuffer, 'char', resultLength);
+        const modelsInfo = JSON.parse(jsonString);
       
-      return {
-        success: true,
-        data: modelsInfo
-      };
-    } catch (error) {
-      return {
-        success: false,
-        error: `Failed to parse models info: ${error.message}`
-      };
-    }
+        return {
+          success: true,
+          data: modelsInfo
+        };
+      } catch (error) {
+        return {
+          success: false,
+          error: `Failed to parse models info: ${error.message}`
+        };
+      }
+    });
   }
 
   static cleanup(): void {